@@ -4,14 +4,22 @@ FIXED: Uses OAuth 1.1 for all Twitter actions (comments, retweets, likes)
 """
 
 from fastapi import FastAPI, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel
 from typing import List, Optional
+from dataclasses import asdict
 import uvicorn
 import re
 import time
 import os
+import logging
+from dotenv import load_dotenv
+
+# Load .env once, before any engine/service reads the environment
+load_dotenv()
+
 from engines.event_engine import SmartEventEngine
 from engines.attendee_engine import SmartAttendeeEngine
 from services.twitter_client import TwitterClient
@@ -31,6 +39,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Engines log through the logging module; show their INFO summaries on stdout
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+
 # Initialize engines
 event_engine = SmartEventEngine()
 attendee_engine = SmartAttendeeEngine()
@@ -108,7 +119,9 @@ async def discover_events(request: EventDiscoveryRequest):
         if request.max_results < 1:
             request.max_results = 1
 
-        events = event_engine.discover_events(
+        # Discovery does blocking network I/O - keep it off the event loop
+        events = await run_in_threadpool(
+            event_engine.discover_events,
             location=request.location,
             start_date=request.start_date,
             end_date=request.end_date,
@@ -118,7 +131,7 @@ async def discover_events(request: EventDiscoveryRequest):
 
         return {
             "success": True,
-            "events": [event.__dict__ for event in events],
+            "events": [asdict(event) for event in events],
             "total_events": len(events),
             "requested_limit": request.max_results
         }
@@ -137,7 +150,8 @@ async def discover_attendees(request: AttendeeDiscoveryRequest):
         if request.max_results < 1:
             request.max_results = 1
 
-        attendees = attendee_engine.discover_attendees(
+        attendees = await run_in_threadpool(
+            attendee_engine.discover_attendees,
             event_name=request.event_name,
             event_date=request.event_date,
             max_results=request.max_results
@@ -145,7 +159,7 @@ async def discover_attendees(request: AttendeeDiscoveryRequest):
 
         return {
             "success": True,
-            "attendees": [attendee.__dict__ for attendee in attendees],
+            "attendees": [asdict(attendee) for attendee in attendees],
             "total_attendees": len(attendees),
             "requested_limit": request.max_results
         }
@@ -5,15 +5,41 @@ Guarantees N results with minimal API calls
 
 import re
 import os
+import string
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from datetime import datetime
 from typing import List, Dict, Optional, Set, Tuple
 from dataclasses import dataclass
-from dotenv import load_dotenv
-from services.twitter_client import TwitterClient
+from services.twitter_client import TwitterClient, SearchResult
+from services.parsing import keyword_pattern
 
-load_dotenv()
+# Punctuation -> space table for per-tweet keyword extraction
+_PUNCT_TABLE = str.maketrans({c: ' ' for c in string.punctuation if c != '_'})
 
-@dataclass
+# Keyword tables used on every tweet
+_STOP_WORDS = frozenset({'the', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by', 'a', 'an'})
+_ENGAGEMENT_PHRASES = frozenset({'attending', 'going to', 'see you at', 'excited for', 'can\'t wait for'})
+_EVENT_WORDS = frozenset({'event', 'concert', 'festival', 'show', 'party'})
+_CONFIRMED_PHRASES = frozenset({'attending', 'going to', 'will be there'})
+_EXCITED_PHRASES = frozenset({'excited for', 'can\'t wait for'})
+_ENGAGEMENT_RE = keyword_pattern(_ENGAGEMENT_PHRASES)
+_EVENT_WORDS_RE = keyword_pattern(_EVENT_WORDS)
+_CONFIRMED_RE = keyword_pattern(_CONFIRMED_PHRASES)
+_EXCITED_RE = keyword_pattern(_EXCITED_PHRASES)
+
+@lru_cache(maxsize=4096)
+def _extract_keywords(event_name: str) -> Tuple[str, ...]:
+    """Extract main keywords (cached - the same event name is scored against every tweet)"""
+    words = event_name.translate(_PUNCT_TABLE).split()
+    
+    keywords = tuple(word.lower() for word in words 
+                     if word.lower() not in _STOP_WORDS 
+                     and len(word) > 2)
+    
+    return keywords if keywords else (event_name.split()[0].lower(),)
+
+@dataclass(slots=True)
 class ResearchAttendee:
     username: str
     display_name: str
@@ -64,16 +90,28 @@ class SmartAttendeeEngine:
         all_attendees = []
         seen_usernames: Set[str] = set()
         
-        # PHASE 1: Exact matches (HIGH SUCCESS RATE)
-        exact_queries = self._generate_exact_queries(event_name, event_date)
-        for query_type, query in exact_queries[:3]:  # Max 3 exact searches
-            if len(all_attendees) >= max_results:
-                break
-            attendees = self._search_and_process(query, event_name, max_results * 3)
+        # PHASE 1: Exact matches (HIGH SUCCESS RATE) - max 3 exact searches
+        exact_queries = self._generate_exact_queries(event_name, event_date)[:3]
+        
+        def add_attendees(attendees):
             for attendee in attendees:
                 if attendee.username not in seen_usernames and len(all_attendees) < max_results:
                     seen_usernames.add(attendee.username)
                     all_attendees.append(attendee)
+        
+        # Top query alone first - it usually fills the target for one search of quota
+        if exact_queries:
+            add_attendees(self._search_and_process(exact_queries[0][1], event_name, max_results * 3))
+        
+        # Short - run the other exact queries concurrently, merged in priority order
+        if len(all_attendees) < max_results and len(exact_queries) > 1:
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                futures = [
+                    executor.submit(self._search_and_process, query, event_name, max_results * 3)
+                    for query_type, query in exact_queries[1:]
+                ]
+                for future in futures:
+                    add_attendees(future.result())
 
         # PHASE 2: Smart keyword expansion (ONLY IF NEEDED)
         if len(all_attendees) < max_results:
@@ -120,7 +158,7 @@ class SmartAttendeeEngine:
 
     def _generate_smart_keyword_queries(self, event_name: str) -> List[Tuple[str, str]]:
         """Generate smart keyword queries"""
-        keywords = self._extract_keywords(event_name)
+        keywords = _extract_keywords(event_name)
         if not keywords:
             return []
             
@@ -133,7 +171,7 @@ class SmartAttendeeEngine:
 
     def _generate_broad_queries(self, event_name: str) -> List[Tuple[str, str]]:
         """Generate broad queries for maximum coverage"""
-        keywords = self._extract_keywords(event_name)
+        keywords = _extract_keywords(event_name)
         if not keywords:
             return []
             
@@ -152,55 +190,59 @@ class SmartAttendeeEngine:
             expansions=['author_id']
         )
 
-        if not tweets or not tweets.data:
+        if not tweets or not tweets.tweets:
             return []
 
         return self._process_tweets_fast(tweets, event_name)
 
-    def _process_tweets_fast(self, tweets, event_name: str) -> List[ResearchAttendee]:
+    def _process_tweets_fast(self, tweets: SearchResult, event_name: str) -> List[ResearchAttendee]:
         """Fast processing with VERY LOW filtering"""
         attendees = []
         
-        if not tweets.includes or 'users' not in tweets.includes:
+        if not tweets.users:
             return attendees
 
-        users_dict = {user.id: user for user in tweets.includes['users']}
+        users_dict = tweets.users
+        status_urls = {user_id: f"https://twitter.com/{user.username}/status/" for user_id, user in users_dict.items()}
+        
+        # Event-side work is the same for every tweet - do it once per batch
+        event_lower = event_name.lower()
+        event_keywords = _extract_keywords(event_name)
 
-        for tweet in tweets.data:
+        for tweet in tweets.tweets:
             user = users_dict.get(tweet.author_id)
             if not user:
                 continue
 
+            # Lowercase once; relevance and engagement both scan the same text
+            text_lower = tweet.text.lower()
+            
             # VERY LOW threshold - include almost everything
-            relevance_score = self._calculate_relevance_score_fast(tweet.text, event_name)
+            relevance_score = self._calculate_relevance_score_fast(text_lower, event_lower, event_keywords)
             
             # Include if even slightly relevant
             if relevance_score >= self.relevance_threshold:
-                followers = user.public_metrics.get('followers_count', 0) if hasattr(user, 'public_metrics') else 0
-
                 attendee = ResearchAttendee(
                     username=f"@{user.username}",
                     display_name=user.name,
-                    bio=user.description or "",
-                    location=user.location or "",
-                    followers_count=followers,
-                    verified=user.verified or False,
+                    bio=user.description,
+                    location=user.location,
+                    followers_count=user.followers_count,
+                    verified=user.verified,
                     confidence_score=0.7,
-                    engagement_type=self._detect_engagement_fast(tweet.text),
+                    engagement_type=self._detect_engagement_fast(text_lower),
                     post_content=tweet.text[:100] + "..." if len(tweet.text) > 100 else tweet.text,
-                    post_date=tweet.created_at.strftime('%Y-%m-%d %H:%M') if hasattr(tweet.created_at, 'strftime') else str(tweet.created_at),
-                    post_link=f"https://twitter.com/{user.username}/status/{tweet.id}",
+                    # 'YYYY-MM-DD HH:MM' - isoformat is C-level and skips strftime's locale handling
+                    post_date=tweet.created_at.isoformat(' ', 'minutes')[:16] if tweet.created_at else "",
+                    post_link=status_urls[tweet.author_id] + str(tweet.id),
                     relevance_score=relevance_score
                 )
                 attendees.append(attendee)
 
         return attendees
 
-    def _calculate_relevance_score_fast(self, tweet_text: str, event_name: str) -> float:
-        """FAST relevance scoring - VERY PERMISSIVE"""
-        text_lower = tweet_text.lower()
-        event_lower = event_name.lower()
-        
+    def _calculate_relevance_score_fast(self, text_lower: str, event_lower: str, keywords: Tuple[str, ...]) -> float:
+        """FAST relevance scoring - VERY PERMISSIVE (expects lowercased tweet text)"""
         score = 0.0
         
         # Exact match (STRONG)
@@ -208,53 +250,31 @@ class SmartAttendeeEngine:
             score += 0.6
         
         # Keyword matches (MEDIUM)
-        keywords = self._extract_keywords(event_name)
         matched_keywords = sum(1 for keyword in keywords if keyword in text_lower)
         score += min(0.3, matched_keywords * 0.1)
         
         # Any engagement signal (WEAK)
-        engagement_phrases = ['attending', 'going to', 'see you at', 'excited for', 'can\'t wait for']
-        for phrase in engagement_phrases:
-            if phrase in text_lower:
-                score += 0.1
-                break
+        if _ENGAGEMENT_RE.search(text_lower):
+            score += 0.1
         
         # Event context words (VERY WEAK)
-        event_words = ['event', 'concert', 'festival', 'show', 'party']
-        for word in event_words:
-            if word in text_lower:
-                score += 0.05
-                break
+        if _EVENT_WORDS_RE.search(text_lower):
+            score += 0.05
         
         return min(1.0, score)
 
-    def _extract_keywords(self, event_name: str) -> List[str]:
-        """Extract main keywords"""
-        stop_words = {'the', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by', 'a', 'an'}
-        
-        clean_name = re.sub(r'[^\w\s]', ' ', event_name)
-        words = clean_name.split()
-        
-        keywords = [word.lower() for word in words 
-                   if word.lower() not in stop_words 
-                   and len(word) > 2]
-        
-        return keywords if keywords else [event_name.split()[0].lower()]
-
     def _clean_event_name(self, event_name: str) -> str:
         """Clean event name for search"""
         if not event_name:
             return "event"
-        cleaned = re.sub(r'[^\w\s]', ' ', event_name)
-        cleaned = re.sub(r'\s+', ' ', cleaned).strip()
+        cleaned = ' '.join(event_name.translate(_PUNCT_TABLE).split())
         return cleaned if cleaned else "event"
 
-    def _detect_engagement_fast(self, tweet_text: str) -> str:
-        """Fast engagement detection"""
-        text_lower = tweet_text.lower()
-        if any(word in text_lower for word in ['attending', 'going to', 'will be there']):
+    def _detect_engagement_fast(self, text_lower: str) -> str:
+        """Fast engagement detection (expects lowercased tweet text)"""
+        if _CONFIRMED_RE.search(text_lower):
             return 'confirmed_attendance'
-        elif any(word in text_lower for word in ['excited for', 'can\'t wait for']):
+        elif _EXCITED_RE.search(text_lower):
             return 'excited'
         else:
             return 'discussing'
\ No newline at end of file
@@ -4,17 +4,198 @@ PROPER date filtering for ANY date range
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import os
 import re
-import json
+import ast
+import logging
+import threading
+import string
+import heapq
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from datetime import datetime, timedelta
-from typing import List, Dict, Set, Optional, Any
+from typing import List, Dict, Set, Optional, Any, Tuple
 from dataclasses import dataclass
-from dotenv import load_dotenv
+from services.ttl_cache import TTLCache
+from services.parsing import json_loads, keyword_pattern
 
-load_dotenv()
+logger = logging.getLogger(__name__)
 
-@dataclass
+# (connect, read) - fail fast on an unreachable host, still allow slow searches
+_SERPAPI_TIMEOUT = (3.05, 27)
+
+# Translation table and precompiled patterns for per-event name normalization
+_PUNCT_DELETE_TABLE = str.maketrans('', '', string.punctuation.replace('_', ''))
+# Date fragments pulled out of SerpAPI dates and user input
+_DAY_RE = re.compile(r'(\d{1,2})')
+_YEAR_RE = re.compile(r'20(\d{2})')
+_ISO_DATE_RE = re.compile(r'\d{4}-\d{2}-\d{2}')
+_MONTH_RE = re.compile(
+    r'(?<![a-z])(jan(?:uary)?|feb(?:ruary)?|mar(?:ch)?|apr(?:il)?|may|june?|july?|aug(?:ust)?'
+    r'|sep(?:t(?:ember)?)?|oct(?:ober)?|nov(?:ember)?|dec(?:ember)?)(?![a-z])',
+    re.IGNORECASE
+)
+_MONTH_MAP = {
+    'jan': 1, 'january': 1, 'feb': 2, 'february': 2,
+    'mar': 3, 'march': 3, 'apr': 4, 'april': 4,
+    'may': 5, 'jun': 6, 'june': 6, 'jul': 7, 'july': 7,
+    'aug': 8, 'august': 8, 'sep': 9, 'sept': 9, 'september': 9,
+    'oct': 10, 'october': 10, 'nov': 11, 'november': 11,
+    'dec': 12, 'december': 12
+}
+# Venue/location/separator suffixes, as one alternation so a title is scanned once
+_NAME_SUFFIX_RE = re.compile(
+    r'\s+at\s+.+$|\s+in\s+.+$|\s*-\s*.+$|\s*\|.*$|\s*@\s*.+$',
+    re.IGNORECASE
+)
+
+# Keyword tables shared by validation, scoring and classification
+_GENERIC_NAMES = frozenset({'event', 'events', 'unknown', 'unknown event'})
+_HYPE_KEYWORDS = frozenset({
+    'festival', 'concert', 'championship', 'tournament', 'expo',
+    'summit', 'conference', 'awards', 'gala', 'premiere'
+})
+_PRESTIGIOUS_VENUES = frozenset({'stadium', 'arena', 'center', 'garden', 'hall'})
+_HYPE_RE = keyword_pattern(_HYPE_KEYWORDS)
+_VENUE_RE = keyword_pattern(_PRESTIGIOUS_VENUES)
+_CATEGORY_WEIGHTS = {
+    'music': 0.3, 'festival': 0.4, 'sports': 0.35,
+    'conference': 0.2, 'arts': 0.25, 'food': 0.15
+}
+_CATEGORY_KEYWORDS = {
+    'music': frozenset({'concert', 'music', 'dj', 'band', 'live music'}),
+    'sports': frozenset({'sports', 'game', 'match', 'tournament'}),
+    'arts': frozenset({'art', 'theater', 'exhibition', 'gallery'}),
+    'food': frozenset({'food', 'drink', 'culinary', 'wine'}),
+    'festival': frozenset({'festival', 'cultural'}),
+    'conference': frozenset({'conference', 'summit', 'workshop'}),
+}
+_CATEGORY_PATTERNS = {category: keyword_pattern(keywords) for category, keywords in _CATEGORY_KEYWORDS.items()}
+
+@lru_cache(maxsize=4096)
+def _classify_event_type(text: str) -> str:
+    """Map an event name to a category (cached - the same names recur across queries)"""
+    if not text:
+        return 'other'
+    text_lower = text.lower()
+    # Categories are checked in priority order, one compiled scan each
+    for category, pattern in _CATEGORY_PATTERNS.items():
+        if pattern.search(text_lower):
+            return category
+    return 'other'
+
+# SerpAPI returns many events sharing the same date string - parse each distinct one once
+@lru_cache(maxsize=4096)
+def _parse_date_info(raw: str) -> Optional[Tuple[Optional[str], Optional[str]]]:
+    """Parse a SerpAPI date dict repr once into (when, start_date), or None if not a dict"""
+    if not raw.startswith('{'):
+        return None
+    try:
+        # literal_eval reads the Python repr directly - apostrophes like "O'Brien's" survive
+        date_dict = ast.literal_eval(raw)
+    except (ValueError, SyntaxError):
+        return None
+    if not isinstance(date_dict, dict):
+        return None
+    return (date_dict.get('when') or None, date_dict.get('start_date') or None)
+
+@lru_cache(maxsize=4096)
+def _parse_date_string(date_str: str, today_ordinal: int) -> Optional[datetime]:
+    """Parse various date string formats (today_ordinal keys the cache per day)"""
+    try:
+        if not date_str:
+            return None
+
+        # Clean the string
+        clean_str = date_str.strip()
+
+        # Handle "Sat, Nov 22, 8 – 11 PM" format - extract date part
+        if ',' in clean_str and _MONTH_RE.search(clean_str):
+            # Extract the date portion (before the first time indicator)
+            date_part = clean_str.split(',')[1].split('–')[0].split('PM')[0].split('AM')[0].strip()
+            clean_str = date_part
+
+        # Try to find month and day
+        month_match = _MONTH_RE.search(clean_str)
+        if month_match:
+            month_num = _MONTH_MAP[month_match.group(1).lower()]
+            # Extract day number
+            day_match = _DAY_RE.search(clean_str)
+            if day_match:
+                day = int(day_match.group(1))
+                # Use current year or next year if month has passed
+                current_year = datetime.now().year
+                proposed_date = datetime(current_year, month_num, day)
+
+                # If the date is in the past, assume next year
+                if proposed_date < datetime.now():
+                    proposed_date = proposed_date.replace(year=current_year + 1)
+
+                return proposed_date
+
+        return None
+
+    except Exception as e:
+        logger.warning("⚠️ Date string parsing error: %s", e)
+        return None
+
+@lru_cache(maxsize=4096)
+def _parse_user_date(date_str: str, current_year: int) -> Optional[datetime]:
+    """Parse user input date (current_year keys the cache)"""
+    try:
+        clean = date_str.strip()
+        
+        # Happy paths: ISO dates (the date picker) and slash dates skip the strptime trial loop
+        if _ISO_DATE_RE.fullmatch(clean):
+            try:
+                return datetime.fromisoformat(clean)
+            except ValueError:
+                pass
+        elif clean.count('/') == 2:
+            first = clean.split('/', 1)[0]
+            fmt = "%d/%m/%Y" if first.isdigit() and int(first) > 12 else "%m/%d/%Y"
+            try:
+                return datetime.strptime(clean, fmt)
+            except ValueError:
+                pass
+        
+        # Handle various formats
+        formats = [
+            "%Y-%m-%d", "%m/%d/%Y", "%d/%m/%Y", 
+            "%B %d, %Y", "%b %d, %Y", "%m-%d-%Y"
+        ]
+
+        for fmt in formats:
+            try:
+                return datetime.strptime(clean, fmt)
+            except ValueError:
+                continue
+
+        # If no format matches, try to interpret
+        clean_date = clean.lower()
+
+        month_match = _MONTH_RE.search(clean_date)
+        if month_match:
+            month_num = _MONTH_MAP[month_match.group(1)]
+            # Extract day and year
+            day_match = _DAY_RE.search(clean_date)
+            year_match = _YEAR_RE.search(clean_date)
+
+            day = int(day_match.group(1)) if day_match else 1
+            year = int(year_match.group()) if year_match else current_year
+
+            return datetime(year, month_num, day)
+
+        logger.warning("❌ Cannot parse user date: %s", date_str)
+        return None
+
+    except Exception as e:
+        logger.warning("❌ User date parsing error: %s", e)
+        return None
+
+@dataclass(slots=True)
 class ResearchEvent:
     event_name: str
     exact_date: str
@@ -30,15 +211,37 @@ class ResearchEvent:
 class SmartEventEngine:
     def __init__(self):
         self.serp_api_key = os.getenv('SERP_API_KEY')
-        print(f"🔧 Event Engine: {'✅ SerpAPI Ready' if self.serp_api_key else '❌ No Key'}")
+        
+        # Persistent session - keep-alive reuses one TLS connection for all SerpAPI queries
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(total=2, backoff_factor=0.3)
+        )
+        self.session.mount("https://", adapter)
+        
+        # Pre-warm the pool in the background so the first user query skips the TCP+TLS handshake
+        # without an unreachable serpapi.com (plus adapter retries) holding up server startup
+        if self.serp_api_key:
+            threading.Thread(target=self._prewarm_session, daemon=True).start()
+        
+        # Popular queries repeat across requests - skip the network (and API quota) for an hour
+        self.response_cache = TTLCache(ttl_seconds=3600, maxsize=512)
+        logger.info("🔧 Event Engine: %s", '✅ SerpAPI Ready' if self.serp_api_key else '❌ No Key')
+
+    def _prewarm_session(self):
+        """Best-effort HEAD that leaves one open connection in the session pool"""
+        try:
+            self.session.head("https://serpapi.com/", timeout=2)
+        except requests.RequestException:
+            pass
 
     def discover_events(self, location: str, start_date: str, end_date: str, categories: List[str], max_results: int) -> List[ResearchEvent]:
         """PROPER DATE RANGE FILTERING: Return events within exact date range"""
         try:
-            print(f"🎯 Finding events in {location} from {start_date} to {end_date}")
-            
             if not self.serp_api_key:
-                print("❌ SerpAPI key missing")
+                logger.error("❌ SerpAPI key missing")
                 return []
 
             # Parse user's date range
@@ -46,101 +249,112 @@ class SmartEventEngine:
             end_dt = self._parse_user_date(end_date)
             
             if not start_dt or not end_dt:
-                print("❌ Invalid date range")
+                logger.error("❌ Invalid date range: %s to %s", start_date, end_date)
                 return []
 
-            print(f"📅 ACTIVE DATE FILTER: {start_dt.strftime('%Y-%m-%d')} to {end_dt.strftime('%Y-%m-%d')}")
+            logger.debug("📅 ACTIVE DATE FILTER: %s to %s", start_dt.date(), end_dt.date())
 
             # Build date-specific queries
             date_queries = self._build_date_specific_queries(location, categories, start_dt, end_dt)
             
-            # Fetch events with date filtering
-            filtered_events = self._fetch_events_with_date_filter(date_queries, start_dt, end_dt, max_results)
-            
-            # Score by hype
-            scored_events = self._score_events_by_hype(filtered_events)
-            top_events = scored_events[:max_results]
+            # Fetch events with date filtering, keeping the top max_results by hype
+            top_events = self._fetch_events_with_date_filter(date_queries, start_dt, end_dt, max_results)
             
-            print(f"✅ FOUND {len(top_events)} events in date range {start_date} to {end_date}")
-            for i, event in enumerate(top_events[:3], 1):
-                print(f"   {i}. {event.event_name} | {event.exact_date}")
+            # One aggregate summary per request instead of a print per line
+            if logger.isEnabledFor(logging.INFO):
+                top_lines = "".join(f"\n   {i}. {event.event_name} | {event.exact_date}" for i, event in enumerate(top_events[:3], 1))
+                logger.info("✅ FOUND %d events in %s from %s to %s%s", len(top_events), location, start_date, end_date, top_lines)
             
             return top_events
 
         except Exception as e:
-            print(f"❌ Event discovery failed: {e}")
+            logger.error("❌ Event discovery failed: %s", e)
             return []
 
     def _build_date_specific_queries(self, location: str, categories: List[str], start_dt: datetime, end_dt: datetime) -> List[str]:
         """Build queries that specifically target the date range"""
         queries = []
         
-        # Generate queries for each month in range
-        current = start_dt
-        while current <= end_dt:
-            month_year = current.strftime("%B %Y")
-            month_name = current.strftime("%B")
-            
-            queries.extend([
-                f"events {location} {month_year}",
-                f"{month_name} events {location} {current.year}",
-                f"upcoming events {location} {month_year}",
-                f"things to do {location} {month_name} {current.year}",
-            ])
-            
-            # Move to next month
-            if current.month == 12:
-                current = current.replace(year=current.year + 1, month=1)
-            else:
-                current = current.replace(month=current.month + 1)
+        # One canonical query per month - SerpAPI returns near-identical results
+        # for "upcoming events X" / "things to do X" style variants
+        # Months are walked as (year * 12 + month) ordinals - no day-of-month rollover to handle
+        for month_index in range(start_dt.year * 12 + start_dt.month - 1, end_dt.year * 12 + end_dt.month):
+            year, month = divmod(month_index, 12)
+            queries.append(f"events {location} {datetime(year, month + 1, 1).strftime('%B %Y')}")
         
-        # Add specific date range queries
-        queries.extend([
-            f"events {location} {start_dt.strftime('%B %d')} to {end_dt.strftime('%B %d %Y')}",
-            f"{location} events {start_dt.year}",
-            f"upcoming events {location} {start_dt.year}",
-        ])
+        # Add specific date range query
+        queries.append(f"events {location} {start_dt.strftime('%B %d')} to {end_dt.strftime('%B %d %Y')}")
         
         # Add category-specific queries
         for category in categories:
-            queries.extend([
-                f"{category} events {location} {start_dt.year}",
-                f"{category} {location} {start_dt.strftime('%B %Y')}",
-            ])
+            queries.append(f"{category} events {location} {start_dt.strftime('%B %Y')}")
         
-        # Remove duplicates
-        return list(dict.fromkeys(queries))
+        # Remove duplicates, including word-order variants
+        unique_queries = []
+        seen_tokens: Set[frozenset] = set()
+        for query in queries:
+            tokens = frozenset(query.lower().split())
+            if tokens not in seen_tokens:
+                seen_tokens.add(tokens)
+                unique_queries.append(query)
+        return unique_queries
 
     def _fetch_events_with_date_filter(self, queries: List[str], start_dt: datetime, end_dt: datetime, max_results: int) -> List[ResearchEvent]:
-        """Fetch events and strictly filter by date range"""
-        all_events = []
-        seen_events: Set[str] = set()
+        """Fetch events, strictly filter by date range and keep the top max_results by hype"""
+        # Min-heap of (hype_score, -arrival, event): the weakest kept event sits at the root
+        top_heap = []
+        accepted = 0
+        seen_events: Set[Tuple[str, str]] = set()
+        # Overlapping queries return identical rows - recognise them before parsing/normalizing
+        seen_raw: Set[Tuple[str, str]] = set()
         
+        # Queries are independent network I/O - fan them out and filter as they complete
+        debug = logger.isEnabledFor(logging.DEBUG)
+        executor = ThreadPoolExecutor(max_workers=8)
+        futures = {}
         for query in queries:
-            if len(all_events) >= max_results * 2:
-                break
-                
-            print(f"🔍 Searching: '{query}'")
-            events = self._fetch_serpapi_events(query, 10)
-            
-            for event in events:
-                # Parse event date properly
-                event_start_dt = self._parse_serpapi_date(event.exact_date)
+            logger.debug("🔍 Searching: '%s'", query)
+            futures[executor.submit(self._fetch_serpapi_events, query, 10)] = query
+        
+        try:
+            for future in as_completed(futures):
+                for event in future.result():
+                    raw_key = (event.event_name, event.exact_date)
+                    if raw_key in seen_raw:
+                        continue
+                    seen_raw.add(raw_key)
+                    
+                    # Parse event date properly
+                    event_start_dt = self._parse_serpapi_date(event.exact_date)
+                    
+                    # STRICT DATE FILTERING
+                    if event_start_dt and start_dt <= event_start_dt <= end_dt:
+                        event_key = self._create_event_key(event)
+                        if event_key not in seen_events:
+                            seen_events.add(event_key)
+                            event.hype_score = self._calculate_hype_score(event)
+                            entry = (event.hype_score, -accepted, event)
+                            accepted += 1
+                            if len(top_heap) < max_results:
+                                heapq.heappush(top_heap, entry)
+                            else:
+                                heapq.heappushpop(top_heap, entry)
+                            if debug:
+                                logger.debug("   ✅ INCLUDED: %s - %s", event.event_name, event_start_dt.strftime('%Y-%m-%d'))
+                    elif event_start_dt:
+                        if debug:
+                            logger.debug("   ❌ EXCLUDED (date): %s - %s", event.event_name, event_start_dt.strftime('%Y-%m-%d'))
+                    elif debug:
+                        logger.debug("   ❌ EXCLUDED (no date): %s", event.event_name)
                 
-                # STRICT DATE FILTERING
-                if event_start_dt and start_dt <= event_start_dt <= end_dt:
-                    event_key = self._create_event_key(event)
-                    if event_key not in seen_events:
-                        seen_events.add(event_key)
-                        all_events.append(event)
-                        print(f"   ✅ INCLUDED: {event.event_name} - {event_start_dt.strftime('%Y-%m-%d')}")
-                elif event_start_dt:
-                    print(f"   ❌ EXCLUDED (date): {event.event_name} - {event_start_dt.strftime('%Y-%m-%d')}")
-                else:
-                    print(f"   ❌ EXCLUDED (no date): {event.event_name}")
+                if accepted >= max_results * 2:
+                    break
+        finally:
+            # Drop queries that have not started once we have enough events
+            executor.shutdown(wait=False, cancel_futures=True)
         
-        print(f"📊 After strict date filtering: {len(all_events)} events")
-        return all_events
+        logger.debug("📊 After strict date filtering: %d events", accepted)
+        return [event for _, _, event in sorted(top_heap, reverse=True)]
 
     def _parse_serpapi_date(self, date_info: Any) -> Optional[datetime]:
         """Parse SerpAPI date format and return clean datetime"""
@@ -148,124 +362,30 @@ class SmartEventEngine:
             if not date_info:
                 return None
             
-            # If it's a dictionary-like string, parse it
-            if isinstance(date_info, str) and date_info.startswith('{'):
-                try:
-                    # Clean the string and parse as JSON
-                    clean_str = date_info.replace("'", '"')
-                    date_dict = json.loads(clean_str)
-                    
-                    # Try start_date first, then when
-                    date_str = date_dict.get('start_date') or date_dict.get('when')
-                    if date_str:
-                        return self._parse_date_string(date_str)
-                except:
-                    pass
-            
-            # If it's a simple string
             if isinstance(date_info, str):
+                # If it's a dictionary-like string, try start_date first, then when
+                parsed = _parse_date_info(date_info)
+                if parsed is not None:
+                    when, start_date = parsed
+                    date_str = start_date or when
+                    return self._parse_date_string(date_str) if date_str else None
+                
+                # If it's a simple string
                 return self._parse_date_string(date_info)
             
             return None
             
         except Exception as e:
-            print(f"⚠️ Date parsing error: {e}")
+            logger.warning("⚠️ Date parsing error: %s", e)
             return None
 
     def _parse_date_string(self, date_str: str) -> Optional[datetime]:
         """Parse various date string formats"""
-        try:
-            if not date_str:
-                return None
-            
-            # Clean the string
-            clean_str = date_str.strip()
-            
-            # Handle "Sat, Nov 22, 8 – 11 PM" format - extract date part
-            if ',' in clean_str and any(month in clean_str.lower() for month in ['jan', 'feb', 'mar', 'apr', 'may', 'jun', 'jul', 'aug', 'sep', 'oct', 'nov', 'dec']):
-                # Extract the date portion (before the first time indicator)
-                date_part = clean_str.split(',')[1].split('–')[0].split('PM')[0].split('AM')[0].strip()
-                clean_str = date_part
-            
-            # Month mapping
-            months = {
-                'jan': 1, 'january': 1, 'feb': 2, 'february': 2,
-                'mar': 3, 'march': 3, 'apr': 4, 'april': 4,
-                'may': 5, 'jun': 6, 'june': 6, 'jul': 7, 'july': 7,
-                'aug': 8, 'august': 8, 'sep': 9, 'sept': 9, 'september': 9,
-                'oct': 10, 'october': 10, 'nov': 11, 'november': 11,
-                'dec': 12, 'december': 12
-            }
-            
-            # Try to find month and day
-            for month_name, month_num in months.items():
-                if month_name in clean_str.lower():
-                    # Extract day number
-                    day_match = re.search(r'(\d{1,2})', clean_str)
-                    if day_match:
-                        day = int(day_match.group(1))
-                        # Use current year or next year if month has passed
-                        current_year = datetime.now().year
-                        proposed_date = datetime(current_year, month_num, day)
-                        
-                        # If the date is in the past, assume next year
-                        if proposed_date < datetime.now():
-                            proposed_date = proposed_date.replace(year=current_year + 1)
-                        
-                        return proposed_date
-            
-            return None
-            
-        except Exception as e:
-            print(f"⚠️ Date string parsing error: {e}")
-            return None
+        return _parse_date_string(date_str, datetime.now().toordinal())
 
     def _parse_user_date(self, date_str: str) -> Optional[datetime]:
         """Parse user input date"""
-        try:
-            # Handle various formats
-            formats = [
-                "%Y-%m-%d", "%m/%d/%Y", "%d/%m/%Y", 
-                "%B %d, %Y", "%b %d, %Y", "%m-%d-%Y"
-            ]
-            
-            for fmt in formats:
-                try:
-                    return datetime.strptime(date_str.strip(), fmt)
-                except ValueError:
-                    continue
-            
-            # If no format matches, try to interpret
-            clean_date = date_str.lower().strip()
-            current_year = datetime.now().year
-            
-            # Month mapping
-            months = {
-                'jan': 1, 'january': 1, 'feb': 2, 'february': 2,
-                'mar': 3, 'march': 3, 'apr': 4, 'april': 4,
-                'may': 5, 'jun': 6, 'june': 6, 'jul': 7, 'july': 7,
-                'aug': 8, 'august': 8, 'sep': 9, 'sept': 9, 'september': 9,
-                'oct': 10, 'october': 10, 'nov': 11, 'november': 11,
-                'dec': 12, 'december': 12
-            }
-            
-            for month_name, month_num in months.items():
-                if month_name in clean_date:
-                    # Extract day and year
-                    day_match = re.search(r'(\d{1,2})', clean_date)
-                    year_match = re.search(r'20(\d{2})', clean_date)
-                    
-                    day = int(day_match.group(1)) if day_match else 1
-                    year = int(year_match.group()) if year_match else current_year
-                    
-                    return datetime(year, month_num, day)
-            
-            print(f"❌ Cannot parse user date: {date_str}")
-            return None
-            
-        except Exception as e:
-            print(f"❌ User date parsing error: {e}")
-            return None
+        return _parse_user_date(date_str, datetime.now().year)
 
     def _fetch_serpapi_events(self, query: str, limit: int) -> List[ResearchEvent]:
         """Fetch events from SerpAPI with CLEAN date display"""
@@ -278,27 +398,33 @@ class SmartEventEngine:
                 "gl": "us"
             }
             
-            response = requests.get("https://serpapi.com/search", params=params, timeout=30)
+            cache_key = (params["q"], params["hl"], params["gl"])
+            data = self.response_cache.get(cache_key)
             
-            if response.status_code == 200:
-                data = response.json()
-                events = []
+            if data is None:
+                response = self.session.get("https://serpapi.com/search", params=params, timeout=_SERPAPI_TIMEOUT)
                 
-                if 'events_results' in data and data['events_results']:
-                    for event_data in data['events_results'][:limit]:
-                        event = self._parse_event_data_clean(event_data)
-                        if event and self._is_valid_event(event):
-                            events.append(event)
-                    
-                    print(f"   📅 Found {len(events)} events for '{query}'")
+                if response.status_code != 200:
+                    logger.warning("   ❌ SerpAPI HTTP %d", response.status_code)
+                    return []
                 
-                return events
-            else:
-                print(f"   ❌ SerpAPI HTTP {response.status_code}")
-                return []
+                data = json_loads(response.content)
+                self.response_cache.set(cache_key, data)
+            
+            events = []
+            
+            if 'events_results' in data and data['events_results']:
+                for event_data in data['events_results'][:limit]:
+                    event = self._parse_event_data_clean(event_data)
+                    if event and self._is_valid_event(event):
+                        events.append(event)
+                
+                logger.debug("   📅 Found %d events for '%s'", len(events), query)
+            
+            return events
                 
         except Exception as e:
-            print(f"   ❌ SerpAPI fetch failed: {e}")
+            logger.warning("   ❌ SerpAPI fetch failed: %s", e)
             return []
 
     def _parse_event_data_clean(self, event_data: Dict) -> ResearchEvent:
@@ -321,7 +447,7 @@ class SmartEventEngine:
                 exact_date=clean_date_display,  # Now shows clean readable date
                 exact_venue=self._extract_venue(address),
                 location=self._extract_location(address),
-                category=self._classify_event_type(clean_name),
+                category=_classify_event_type(clean_name),
                 confidence_score=0.8,
                 source_url=link,
                 posted_by="Event Search",
@@ -331,7 +457,7 @@ class SmartEventEngine:
             return event
             
         except Exception as e:
-            print(f"⚠️ Event parse error: {e}")
+            logger.warning("⚠️ Event parse error: %s", e)
             return None
 
     def _clean_date_display(self, raw_date: Any) -> str:
@@ -341,88 +467,57 @@ class SmartEventEngine:
                 return "Date not specified"
             
             # If it's a dictionary-like string, extract readable date
-            if isinstance(raw_date, str) and raw_date.startswith('{'):
-                try:
-                    clean_str = raw_date.replace("'", '"')
-                    date_dict = json.loads(clean_str)
-                    
+            if isinstance(raw_date, str):
+                parsed = _parse_date_info(raw_date)
+                if parsed is not None:
+                    when, start_date = parsed
                     # Prefer 'when' field as it's more descriptive
-                    if date_dict.get('when'):
-                        return date_dict['when']
-                    elif date_dict.get('start_date'):
-                        return f"Starts: {date_dict['start_date']}"
-                    
-                except:
-                    pass
+                    if when:
+                        return when
+                    elif start_date:
+                        return f"Starts: {start_date}"
             
             # If it's already a clean string, return as is
             return str(raw_date)
             
         except Exception as e:
-            print(f"⚠️ Date display cleaning error: {e}")
+            logger.warning("⚠️ Date display cleaning error: %s", e)
             return "Date information available"
 
-    def _create_event_key(self, event: ResearchEvent) -> str:
-        """Create unique key for event deduplication"""
-        normalized_name = re.sub(r'[^\w\s]', '', event.event_name.lower())
-        normalized_name = re.sub(r'\s+', ' ', normalized_name).strip()
+    def _create_event_key(self, event: ResearchEvent) -> Tuple[str, str]:
+        """Create unique (name, date) key for event deduplication"""
+        normalized_name = ' '.join(event.event_name.lower().translate(_PUNCT_DELETE_TABLE).split())
         date_part = event.exact_date.split()[0] if event.exact_date else "nodate"
-        return f"{normalized_name}_{date_part}"
+        return (normalized_name, date_part)
 
     def _is_valid_event(self, event: ResearchEvent) -> bool:
         """Validate event before including"""
         if not event.event_name or len(event.event_name.strip()) < 3:
             return False
-        generic_names = ['event', 'events', 'unknown', 'unknown event']
-        if event.event_name.lower() in generic_names:
+        if event.event_name.lower() in _GENERIC_NAMES:
             return False
         return True
 
-    def _score_events_by_hype(self, events: List[ResearchEvent]) -> List[ResearchEvent]:
-        """Score events based on hype"""
-        scored_events = []
-        for event in events:
-            hype_score = self._calculate_hype_score(event)
-            event.hype_score = hype_score
-            scored_events.append(event)
-        scored_events.sort(key=lambda x: x.hype_score, reverse=True)
-        return scored_events
-
     def _calculate_hype_score(self, event: ResearchEvent) -> float:
         """Calculate hype score"""
         score = 0.0
         name_lower = event.event_name.lower()
-        hype_keywords = [
-            'festival', 'concert', 'championship', 'tournament', 'expo',
-            'summit', 'conference', 'awards', 'gala', 'premiere'
-        ]
-        for keyword in hype_keywords:
-            if keyword in name_lower:
-                score += 0.1
+        # One scan per string; each distinct keyword counts once
+        score += 0.1 * len(set(_HYPE_RE.findall(name_lower)))
+        if score >= 1.0:
+            return 1.0
         venue_lower = event.exact_venue.lower()
-        prestigious_venues = ['stadium', 'arena', 'center', 'garden', 'hall']
-        for venue in prestigious_venues:
-            if venue in venue_lower:
-                score += 0.15
-        category_weights = {
-            'music': 0.3, 'festival': 0.4, 'sports': 0.35,
-            'conference': 0.2, 'arts': 0.25, 'food': 0.15
-        }
-        score += category_weights.get(event.category, 0.1)
-        return min(1.0, score)
+        score += 0.15 * len(set(_VENUE_RE.findall(venue_lower)))
+        if score >= 1.0:
+            return 1.0
+        score += _CATEGORY_WEIGHTS.get(event.category, 0.1)
+        return score if score < 1.0 else 1.0
 
     def _clean_event_name(self, title: str) -> str:
         """Clean event name"""
         if not title:
             return "Event"
-        patterns_to_remove = [
-            r'\s+at\s+.+$', r'\s+in\s+.+$', r'\s*-\s*.+$',
-            r'\s*\|.*$', r'\s*@\s*.+$'
-        ]
-        clean_name = title
-        for pattern in patterns_to_remove:
-            clean_name = re.sub(pattern, '', clean_name, flags=re.IGNORECASE)
-        clean_name = re.sub(r'\s+', ' ', clean_name).strip()
+        clean_name = ' '.join(_NAME_SUFFIX_RE.sub('', title).split())
         return clean_name if clean_name else title
 
     def _safe_extract(self, field):
@@ -440,21 +535,4 @@ class SmartEventEngine:
         if not address:
             return "Location not specified"
         parts = address.split(',')
-        return parts[-1].strip() if len(parts) > 1 else address
-
-    def _classify_event_type(self, text: str) -> str:
-        if not text:
-            return 'other'
-        text_lower = text.lower()
-        categories = {
-            'music': ['concert', 'music', 'dj', 'band', 'live music'],
-            'sports': ['sports', 'game', 'match', 'tournament'],
-            'arts': ['art', 'theater', 'exhibition', 'gallery'],
-            'food': ['food', 'drink', 'culinary', 'wine'],
-            'festival': ['festival', 'cultural'],
-            'conference': ['conference', 'summit', 'workshop'],
-        }
-        for category, keywords in categories.items():
-            if any(keyword in text_lower for keyword in keywords):
-                return category
-        return 'other'
\ No newline at end of file
+        return parts[-1].strip() if len(parts) > 1 else address
\ No newline at end of file
@@ -6,6 +6,8 @@ Run this to get your OAuth 2.0 User Access Token
 
 import os
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import base64
 import webbrowser
 from urllib.parse import urlencode
@@ -61,7 +63,10 @@ def get_oauth_token():
             'code_verifier': 'challenge'
         }
         
-        response = requests.post(
+        session = requests.Session()
+        session.mount("https://", HTTPAdapter(max_retries=Retry(total=2, backoff_factor=0.3)))
+        
+        response = session.post(
             'https://api.twitter.com/2/oauth2/token',
             headers={
                 'Content-Type': 'application/x-www-form-urlencoded',
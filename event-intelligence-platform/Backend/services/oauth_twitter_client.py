@@ -6,10 +6,10 @@ Uses OAuth 2.0 User Context with your existing credentials
 
 import os
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import Optional, Dict
-from dotenv import load_dotenv
-
-load_dotenv()
+from services.parsing import json_loads
 
 class OAuthTwitterClient:
     def __init__(self):
@@ -17,6 +17,17 @@ class OAuthTwitterClient:
         self.access_token = os.getenv('TWITTER_OAUTH2_ACCESS_TOKEN')
         self.base_url = "https://api.twitter.com/2"
         
+        # One keep-alive session for all calls - amortizes TCP+TLS setup to api.twitter.com
+        # (urllib3 never retries POST on a status code, so tweets cannot be double-posted)
+        self.session = requests.Session()
+        self.session.mount("https://", HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=10,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+        ))
+        if self.is_configured():
+            self.session.headers.update(self._get_auth_headers())
+        
     def is_configured(self) -> bool:
         """Check if OAuth 2.0 access token is available"""
         return self.access_token is not None
@@ -41,15 +52,10 @@ class OAuthTwitterClient:
                 payload['reply'] = {'in_reply_to_tweet_id': reply_to_tweet_id}
             
             print(f"🐦 Posting tweet: {text[:50]}...")
-            response = requests.post(
-                url,
-                headers=self._get_auth_headers(),
-                json=payload,
-                timeout=30
-            )
+            response = self.session.post(url, json=payload, timeout=30)
             
             if response.status_code == 201:
-                result = response.json()
+                result = json_loads(response.content)
                 print(f"✅ Tweet posted successfully: {result['data']['id']}")
                 return {
                     'success': True,
@@ -57,7 +63,7 @@ class OAuthTwitterClient:
                     'text': text
                 }
             else:
-                error_msg = response.json().get('detail', 'Unknown error')
+                error_msg = json_loads(response.content).get('detail', 'Unknown error')
                 print(f"❌ Tweet failed: {error_msg}")
                 return {
                     'success': False,
@@ -75,14 +81,10 @@ class OAuthTwitterClient:
                 return {'success': False, 'error': 'OAuth 2.0 not configured'}
             
             url = f"{self.base_url}/users/me"
-            response = requests.get(
-                url,
-                headers=self._get_auth_headers(),
-                timeout=30
-            )
+            response = self.session.get(url, timeout=30)
             
             if response.status_code == 200:
-                result = response.json()
+                result = json_loads(response.content)
                 return {
                     'success': True,
                     'user': result['data']
@@ -110,15 +112,10 @@ class OAuthTwitterClient:
             }
             
             print(f"🔁 Posting quote tweet: {text[:50]}...")
-            response = requests.post(
-                url,
-                headers=self._get_auth_headers(),
-                json=payload,
-                timeout=30
-            )
+            response = self.session.post(url, json=payload, timeout=30)
             
             if response.status_code == 201:
-                result = response.json()
+                result = json_loads(response.content)
                 print(f"✅ Quote tweet posted successfully: {result['data']['id']}")
                 return {
                     'success': True,
@@ -127,7 +124,7 @@ class OAuthTwitterClient:
                     'quoted_tweet_id': tweet_id
                 }
             else:
-                error_msg = response.json().get('detail', 'Unknown error')
+                error_msg = json_loads(response.content).get('detail', 'Unknown error')
                 print(f"❌ Quote tweet failed: {error_msg}")
                 return {
                     'success': False,
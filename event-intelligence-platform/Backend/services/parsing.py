@@ -0,0 +1,19 @@
+"""
+PARSING HELPERS - SHARED
+Fast JSON decoding and keyword matching used by the engines and API clients
+"""
+
+import re
+import json
+
+# orjson decodes API payloads 2-3x faster; stdlib json accepts bytes too
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
+
+def keyword_pattern(keywords) -> re.Pattern:
+    """Compile keywords into one alternation (longest first) so a string is scanned once"""
+    return re.compile('|'.join(re.escape(k) for k in sorted(keywords, key=len, reverse=True)))
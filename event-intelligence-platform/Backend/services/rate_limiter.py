@@ -3,8 +3,8 @@ ADVANCED RATE LIMITER - FINAL
 Preserves quotas across all system phases
 """
 
-from datetime import datetime, timedelta
 import threading
+import time
 
 class TwitterRateLimiter:
     def __init__(self):
@@ -41,31 +41,35 @@ class TwitterRateLimiter:
                 return True
 
             limit_info = self.rate_limits[endpoint]
-            now = datetime.now()
+            # reset_time is a time.monotonic() deadline - immune to wall-clock jumps
+            now = time.monotonic()
 
             # Initialize reset time if not set
             if not limit_info['reset_time']:
-                limit_info['reset_time'] = now + timedelta(minutes=limit_info['window_minutes'])
+                limit_info['reset_time'] = now + limit_info['window_minutes'] * 60
 
             # Reset if time window passed
             if now > limit_info['reset_time']:
                 limit_info['remaining'] = limit_info['limit']
-                limit_info['reset_time'] = now + timedelta(minutes=limit_info['window_minutes'])
+                limit_info['reset_time'] = now + limit_info['window_minutes'] * 60
 
             if limit_info['remaining'] > 0:
                 limit_info['remaining'] -= 1
                 return True
-            else:
-                print(f"🚫 {endpoint} limit: {limit_info['remaining']}/{limit_info['limit']}")
-                return False
+            limit = limit_info['limit']
+
+        # Report outside the lock so a blocked caller does not hold up the others
+        print(f"🚫 {endpoint} limit: 0/{limit}")
+        return False
 
     def get_limits_status(self):
         """Get comprehensive status"""
         status = {}
+        now = time.monotonic()
         for endpoint, limit_info in self.rate_limits.items():
             reset_in = 0
             if limit_info['reset_time']:
-                reset_in = max(0, (limit_info['reset_time'] - datetime.now()).total_seconds() / 60)
+                reset_in = max(0, (limit_info['reset_time'] - now) / 60)
             
             status[endpoint] = {
                 'remaining': limit_info['remaining'],
@@ -0,0 +1,37 @@
+"""
+TTL CACHE - IN-PROCESS
+Thread-safe expiring cache for repeated API lookups
+"""
+
+import threading
+import time
+from typing import Any, Hashable
+
+
+class TTLCache:
+    def __init__(self, ttl_seconds: float, maxsize: int = 256):
+        self.ttl_seconds = ttl_seconds
+        self.maxsize = maxsize
+        self._entries = {}  # key -> (expires_at, value), oldest first
+        self.lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value, or default if missing/expired"""
+        with self.lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+
+            expires_at, value = entry
+            if time.monotonic() >= expires_at:
+                del self._entries[key]
+                return default
+            return value
+
+    def set(self, key: Hashable, value: Any):
+        """Store value for ttl_seconds, evicting the oldest entry when full"""
+        with self.lock:
+            self._entries.pop(key, None)
+            if len(self._entries) >= self.maxsize:
+                self._entries.pop(next(iter(self._entries)))
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
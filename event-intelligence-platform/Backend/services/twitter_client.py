@@ -4,110 +4,480 @@ Combines OAuth 1.1 (working) + v2 API + Rate Limiting + Basic Tier compatibility
 """
 
 import os
+import json
+import hashlib
+import logging
+import asyncio
 import tweepy
 import time
+import threading
+from functools import lru_cache, partial, wraps
+from dataclasses import asdict, dataclass, field
 from datetime import datetime
-from dotenv import load_dotenv
+from typing import Dict, List, Optional
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from services.ttl_cache import TTLCache
 
-load_dotenv()
+# Redis is optional - only used to share the search quota when REDIS_URL is set
+try:
+    import redis
+except ImportError:
+    redis = None
+
+logger = logging.getLogger(__name__)
+
+# Local guess used until Twitter's x-rate-limit-* headers report the real window
+_DEFAULT_SEARCH_LIMIT = 60
+_DEFAULT_WINDOW_SECONDS = 900
+
+# Backoff for 5xx on searches only (idempotent GETs, run off the event loop) -
+# writes are never retried since a 5xx POST may already have been applied.
+# 429s are not retried here: the caller benches the token and _pick_token fails over.
+_BACKOFF_ATTEMPTS = 5
+_BACKOFF_MAX_SECONDS = 60
+
+def _with_backoff(func):
+    """Retry a tweepy call on 5xx with exponential backoff (1, 2, 4, 8s)"""
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        for attempt in range(_BACKOFF_ATTEMPTS):
+            try:
+                return func(*args, **kwargs)
+            except tweepy.TwitterServerError as e:
+                if attempt == _BACKOFF_ATTEMPTS - 1:
+                    raise
+                
+                delay = min(2 ** attempt, _BACKOFF_MAX_SECONDS)
+                logger.warning("⏳ Twitter returned %s - retrying in %.1fs", e.response.status_code, delay)
+                time.sleep(delay)
+    return wrapper
+
+def _mount_pooled_adapter(session):
+    """Keep-alive pool for a tweepy session - retries connection errors only, status codes
+    are left to tweepy's exceptions (5xx backoff in _with_backoff, 429s via the quota)"""
+    session.mount("https://", HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=16,
+        max_retries=Retry(total=3, backoff_factor=1)
+    ))
+
+class _RateLimitAwareClient(tweepy.Client):
+    """tweepy.Client that keeps each thread's last raw response for its rate-limit headers"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._local = threading.local()
+
+    @property
+    def last_response(self):
+        return getattr(self._local, 'response', None)
+
+    def request(self, *args, **kwargs):
+        response = super().request(*args, **kwargs)
+        self._local.response = response
+        return response
+
+class ConfigError(Exception):
+    """Twitter credentials missing or unusable"""
+
+@dataclass(frozen=True, slots=True)
+class TwitterCreds:
+    """One set of Twitter credentials - field names match tweepy.Client kwargs"""
+    consumer_key: Optional[str] = None
+    consumer_secret: Optional[str] = None
+    access_token: Optional[str] = None
+    access_token_secret: Optional[str] = None
+    bearer_token: Optional[str] = None
+
+    @property
+    def has_user_auth(self) -> bool:
+        """Full OAuth 1.0a set - needed for posting and v1.1"""
+        return all([self.consumer_key, self.consumer_secret, self.access_token, self.access_token_secret])
+
+    @property
+    def can_authenticate(self) -> bool:
+        """A bearer token or a full OAuth 1.0a set - anything less cannot make a call"""
+        return bool(self.bearer_token) or self.has_user_auth
+
+    @classmethod
+    def from_env(cls) -> 'TwitterCreds':
+        """Read TWITTER_* env vars; ConfigError if neither bearer nor OAuth 1.0a creds are set"""
+        creds = cls(
+            consumer_key=os.getenv('TWITTER_API_KEY'),
+            consumer_secret=os.getenv('TWITTER_API_SECRET'),
+            access_token=os.getenv('TWITTER_ACCESS_TOKEN'),
+            access_token_secret=os.getenv('TWITTER_ACCESS_TOKEN_SECRET'),
+            bearer_token=os.getenv('TWITTER_BEARER_TOKEN')
+        )
+        if not creds.can_authenticate:
+            raise ConfigError("Set TWITTER_BEARER_TOKEN or all four TWITTER_API_*/TWITTER_ACCESS_* variables")
+        return creds
+
+@lru_cache(maxsize=1)
+def _env_creds() -> TwitterCreds:
+    """Env creds read once per process (a ConfigError is not cached)"""
+    return TwitterCreds.from_env()
+
+@dataclass(slots=True)
+class TweetDTO:
+    """The tweet fields callers use - cheap to cache and serialize"""
+    id: int
+    text: str
+    author_id: Optional[int]  # None unless author_id was requested
+    created_at: Optional[datetime]
+
+@dataclass(slots=True)
+class UserDTO:
+    """The author fields callers use"""
+    id: int
+    username: str
+    name: str
+    description: str
+    location: str
+    verified: bool
+    followers_count: int
+
+@dataclass(slots=True)
+class SearchResult:
+    """Projected recent-search response: tweets plus their authors keyed by id"""
+    tweets: List[TweetDTO]
+    users: Dict[int, UserDTO]
+
+def _to_search_result(response) -> SearchResult:
+    """Project a tweepy Response down to the DTOs, dropping meta and unused includes"""
+    users = {
+        int(user.id): UserDTO(
+            id=int(user.id),
+            username=user.username,
+            name=user.name,
+            description=user.description or "",
+            location=user.location or "",
+            verified=user.verified or False,
+            followers_count=(user.public_metrics or {}).get('followers_count', 0)
+        )
+        for user in (response.includes or {}).get('users', [])
+    }
+    tweets = [
+        TweetDTO(
+            int(tweet.id),
+            tweet.text,
+            int(tweet.author_id) if tweet.author_id is not None else None,
+            tweet.created_at
+        )
+        for tweet in response.data or []
+    ]
+    return SearchResult(tweets, users)
+
+@dataclass(slots=True)
+class _SearchToken:
+    """One credential set's search client and its own rate-limit window"""
+    client: tweepy.Client
+    shared_key: str  # Redis counter key - derived from the credential, same in every worker
+    limit: int = _DEFAULT_SEARCH_LIMIT
+    remaining: int = _DEFAULT_SEARCH_LIMIT
+    reset_at: float = field(default_factory=lambda: time.monotonic() + _DEFAULT_WINDOW_SECONDS)  # monotonic deadline
+    searches_used: int = 0
+
+def _load_pool_creds():
+    """Extra search credentials: TWITTER_CREDS_JSON='[{"bearer_token": "..."}, ...]'"""
+    raw = os.getenv('TWITTER_CREDS_JSON')
+    if not raw:
+        return []
+    try:
+        entries = json.loads(raw)
+    except ValueError as e:
+        logger.warning("⚠️ Ignoring TWITTER_CREDS_JSON: %s", e)
+        return []
+    if not isinstance(entries, list):
+        logger.warning("⚠️ Ignoring TWITTER_CREDS_JSON: expected a list of objects")
+        return []
+    
+    fields = TwitterCreds.__dataclass_fields__
+    pool = []
+    for entry in entries:
+        if not isinstance(entry, dict):
+            logger.warning("⚠️ Skipping TWITTER_CREDS_JSON entry: expected an object, got %s", type(entry).__name__)
+            continue
+        creds = TwitterCreds(**{key: value for key, value in entry.items() if key in fields})
+        if not creds.can_authenticate:
+            logger.warning("⚠️ Skipping TWITTER_CREDS_JSON entry: needs bearer_token or all four OAuth 1.0a keys")
+            continue
+        pool.append(creds)
+    return pool
+
+def _shared_quota_key(creds: TwitterCreds) -> str:
+    """Stable per-credential Redis key that never exposes the secret itself"""
+    identity = creds.bearer_token or f"{creds.consumer_key}:{creds.access_token}"
+    return "twitter:search_quota:" + hashlib.sha256(identity.encode()).hexdigest()[:16]
+
+# Atomically take one search from a shared per-token counter; the key expires with the window
+_SHARED_QUOTA_LUA = """
+local left = redis.call('GET', KEYS[1])
+if not left then
+    left = tonumber(ARGV[1]) - 1
+    redis.call('SET', KEYS[1], left, 'EX', ARGV[2])
+    return left
+end
+return redis.call('DECR', KEYS[1])
+"""
+
+@lru_cache(maxsize=1)
+def _shared_quota_script():
+    """Registered Lua script on REDIS_URL (one connection pool per process), or None"""
+    url = os.getenv('REDIS_URL')
+    if not url:
+        return None
+    if redis is None:
+        logger.warning("⚠️ REDIS_URL set but redis is not installed - quota stays per-process")
+        return None
+    # Short timeouts - an unreachable Redis must not stall searches
+    client = redis.Redis.from_url(url, socket_connect_timeout=0.5, socket_timeout=0.5)
+    return client.register_script(_SHARED_QUOTA_LUA)
 
 class TwitterClient:
-    def __init__(self):
-        self.consumer_key = os.getenv('TWITTER_API_KEY')
-        self.consumer_secret = os.getenv('TWITTER_API_SECRET')
-        self.access_token = os.getenv('TWITTER_ACCESS_TOKEN')
-        self.access_token_secret = os.getenv('TWITTER_ACCESS_TOKEN_SECRET')
-        self.bearer_token = os.getenv('TWITTER_BEARER_TOKEN')
+    __slots__ = (
+        'creds', 'client_v2', 'api_v1',
+        'token_pool', '_quota_lock', '_search_cache'
+    )
+
+    def __init__(self, creds: Optional[TwitterCreds] = None):
+        if creds is None:
+            try:
+                creds = _env_creds()
+            except ConfigError as e:
+                logger.error("❌ Twitter config: %s", e)
+                creds = TwitterCreds()
+        self.creds = creds
         
         # Dual clients for maximum compatibility
         self.client_v2 = None  # v2 API for posting (PROVEN WORKING)
         self.api_v1 = None     # v1.1 API for search
-        self.rate_limit_remaining = 60
-        self.last_reset_time = datetime.now()
-        self.total_searches_used = 0
+        self.token_pool = []   # search tokens - each search uses the one with most quota left
+        self._quota_lock = threading.Lock()  # searches may run concurrently
+        self._search_cache = TTLCache(ttl_seconds=60, maxsize=256)  # repeat queries skip the quota
         self.setup_clients()
 
     def setup_clients(self):
         """Setup both v2 and v1.1 clients"""
         try:
             # v2 Client for posting (YOUR WORKING CODE)
-            self.client_v2 = tweepy.Client(
-                consumer_key=self.consumer_key,
-                consumer_secret=self.consumer_secret,
-                access_token=self.access_token,
-                access_token_secret=self.access_token_secret,
-                bearer_token=self.bearer_token,
-                wait_on_rate_limit=False
-            )
+            self.client_v2 = _RateLimitAwareClient(**asdict(self.creds), wait_on_rate_limit=False)
+            _mount_pooled_adapter(self.client_v2.session)
+            
+            # Search token pool starts with the primary creds
+            self.token_pool = [_SearchToken(self.client_v2, _shared_quota_key(self.creds))]
             
             # v1.1 API for search (backup)
-            if all([self.consumer_key, self.consumer_secret, self.access_token, self.access_token_secret]):
+            if self.creds.has_user_auth:
                 auth = tweepy.OAuth1UserHandler(
-                    self.consumer_key, self.consumer_secret,
-                    self.access_token, self.access_token_secret
+                    self.creds.consumer_key, self.creds.consumer_secret,
+                    self.creds.access_token, self.creds.access_token_secret
                 )
                 self.api_v1 = tweepy.API(auth)
+                # Both clients talk to api.twitter.com - share one keep-alive pool
+                self.api_v1.session = self.client_v2.session
             
-            print("✅ Twitter clients: v2 (posting) + v1.1 (search)")
-            
-            # Test authentication
-            user = self.client_v2.get_me()
-            print(f"✅ Authenticated as: @{user.data.username}")
+            # Search token pool: extras from TWITTER_CREDS_JSON - a bad entry only loses itself
+            for creds in _load_pool_creds():
+                try:
+                    client = _RateLimitAwareClient(**asdict(creds), wait_on_rate_limit=False)
+                    _mount_pooled_adapter(client.session)
+                    self.token_pool.append(_SearchToken(client, _shared_quota_key(creds)))
+                except Exception as e:
+                    logger.warning("⚠️ Skipping pooled Twitter credentials: %s", e)
             
+            # No network here - tweepy takes the acting user from the OAuth1 access token
+            logger.info("✅ Twitter clients: v2 (posting) + v1.1 (search)")
             return True
         except Exception as e:
-            print(f"❌ Twitter setup failed: {e}")
+            logger.error("❌ Twitter setup failed: %s", e)
             return False
 
-    def _check_rate_limit(self):
-        """Manual rate limit checking"""
-        now = datetime.now()
-        time_since_reset = (now - self.last_reset_time).total_seconds()
+    @property
+    def rate_limit_remaining(self):
+        return sum(token.remaining for token in self.token_pool)
+
+    @property
+    def rate_limit_limit(self):
+        return sum(token.limit for token in self.token_pool)
+
+    @property
+    def total_searches_used(self):
+        return sum(token.searches_used for token in self.token_pool)
+
+    def _check_rate_limit(self, token: _SearchToken):
+        """Rate limit checking against the token's last known Twitter window"""
+        now = time.monotonic()
         
-        # Reset every 15 minutes
-        if time_since_reset >= 900:
-            self.rate_limit_remaining = 60
-            self.last_reset_time = now
-            self.total_searches_used = 0
+        # Window has rolled over - assume a full quota until headers say otherwise
+        if now >= token.reset_at:
+            token.remaining = token.limit
+            token.reset_at = now + _DEFAULT_WINDOW_SECONDS
+            token.searches_used = 0
         
-        if self.rate_limit_remaining <= 0:
+        if token.remaining <= 0:
             return False
         return True
 
-    def search_recent_tweets_safe(self, query: str, max_results: int = 10, **kwargs):
-        """Optimized search with manual rate limiting"""
+    def _reserve_shared(self, token: _SearchToken) -> bool:
+        """Take one search from the cross-process Redis counter; always True without Redis"""
         try:
-            if not self._check_rate_limit():
-                print("🚫 Search blocked: Rate limit reached")
+            script = _shared_quota_script()
+            if script is None:
+                return True
+            return script(keys=[token.shared_key], args=[token.limit, _DEFAULT_WINDOW_SECONDS]) >= 0
+        except Exception as e:
+            # Fail open - the per-process quota and Twitter's headers still apply
+            logger.warning("⚠️ Shared quota unavailable: %s", e)
+            return True
+
+    def _pick_token(self):
+        """Token with the most remaining quota (one shared search reserved), or None if all are exhausted"""
+        while True:
+            with self._quota_lock:
+                available = [token for token in self.token_pool if self._check_rate_limit(token)]
+                token = max(available, key=lambda token: token.remaining, default=None)
+            
+            # Redis round-trip happens outside the lock so concurrent searches don't queue on it
+            if token is None or self._reserve_shared(token):
+                return token
+            
+            # Other workers used up this window - stop offering the token locally too
+            with self._quota_lock:
+                token.remaining = 0
+
+    def _apply_rate_limit_headers(self, token: _SearchToken, response) -> bool:
+        """Sync the quota from x-rate-limit-* headers; False if the response had none"""
+        if response is None:
+            return False
+        headers = response.headers
+        remaining = headers.get('x-rate-limit-remaining')
+        reset = headers.get('x-rate-limit-reset')
+        if remaining is None or reset is None:
+            return False
+        
+        token.remaining = int(remaining)
+        # Header reset is epoch seconds - convert once to a monotonic deadline
+        token.reset_at = time.monotonic() + (float(reset) - time.time())
+        limit = headers.get('x-rate-limit-limit')
+        if limit is not None:
+            token.limit = int(limit)
+        return True
+
+    @_with_backoff
+    def _do_search(self, client, **params):
+        return client.search_recent_tweets(**params)
+
+    def search_recent_tweets_safe(self, query: str, max_results: int = 10, **kwargs) -> Optional[SearchResult]:
+        """Optimized search with manual rate limiting - None if blocked or failed"""
+        cache_key = (query, max_results, tuple(sorted(
+            (key, tuple(value) if isinstance(value, list) else value) for key, value in kwargs.items()
+        )))
+        cached = self._search_cache.get(cache_key)
+        if cached is not None:
+            logger.debug("⚡ Cached search: '%s'", query)
+            return cached
+        
+        token = None
+        try:
+            token = self._pick_token()
+            if token is None:
+                logger.warning("🚫 Search blocked: Rate limit reached")
                 return None
             
-            print(f"🔍 Searching: '{query}'")
-            print(f"📊 Quota: {self.rate_limit_remaining}/60 searches left")
+            logger.info("🔍 Searching: '%s'", query)
+            logger.debug("📊 Quota: %d/%d searches left", self.rate_limit_remaining, self.rate_limit_limit)
             
-            response = self.client_v2.search_recent_tweets(
+            response = self._do_search(
+                token.client,
                 query=query,
                 max_results=min(max_results, 15),
                 **kwargs
             )
             
-            self.rate_limit_remaining -= 1
-            self.total_searches_used += 1
+            with self._quota_lock:
+                if not self._apply_rate_limit_headers(token, token.client.last_response):
+                    token.remaining -= 1
+                token.searches_used += 1
             
-            if response and response.data:
-                print(f"✅ Found {len(response.data)} tweets")
+            result = _to_search_result(response)
+            if result.tweets:
+                logger.info("✅ Found %d tweets", len(result.tweets))
             else:
-                print("❌ No tweets found")
+                logger.info("❌ No tweets found")
             
-            return response
+            self._search_cache.set(cache_key, result)
+            return result
             
+        except tweepy.TooManyRequests as e:
+            with self._quota_lock:
+                if not self._apply_rate_limit_headers(token, e.response):
+                    token.remaining = 0
+            logger.warning("🚫 Search rate limited by Twitter: %s", e)
+            return None
+        except (tweepy.Unauthorized, tweepy.Forbidden) as e:
+            # Bad or revoked credential - bench the token for this window so others get picked
+            with self._quota_lock:
+                token.remaining = 0
+            logger.error("❌ Search failed: %s", e)
+            return None
         except Exception as e:
-            print(f"❌ Search failed: {e}")
+            logger.error("❌ Search failed: %s", e)
             return None
 
+    def search_many(self, query: str, total: int, **kwargs) -> Optional[SearchResult]:
+        """Fetch up to `total` tweets in 100-per-call pages - one quota token per page, not per 15"""
+        token = self._pick_token()
+        if token is None:
+            logger.warning("🚫 Search blocked: Rate limit reached")
+            return None
+        
+        per_page = max(10, min(total, 100))
+        pages = -(-total // per_page)
+        result = SearchResult([], {})
+        logger.info("🔍 Searching: '%s' (up to %d tweets in %d pages)", query, total, pages)
+        
+        try:
+            for response in tweepy.Paginator(token.client.search_recent_tweets,
+                                             query=query, max_results=per_page, limit=pages, **kwargs):
+                with self._quota_lock:
+                    if not self._apply_rate_limit_headers(token, token.client.last_response):
+                        token.remaining -= 1
+                    token.searches_used += 1
+                    exhausted = token.remaining <= 0
+                
+                page = _to_search_result(response)
+                result.tweets.extend(page.tweets)
+                result.users.update(page.users)
+                if len(result.tweets) >= total or exhausted or not (response.meta or {}).get('next_token'):
+                    break
+                
+                # Each further page is another API call - reserve it in the shared quota first
+                if not self._reserve_shared(token):
+                    logger.warning("🚫 Shared search quota used up - stopping after %d tweets", len(result.tweets))
+                    break
+        except tweepy.TooManyRequests as e:
+            with self._quota_lock:
+                if not self._apply_rate_limit_headers(token, e.response):
+                    token.remaining = 0
+            logger.warning("🚫 Search rate limited by Twitter: %s", e)
+        except (tweepy.Unauthorized, tweepy.Forbidden) as e:
+            with self._quota_lock:
+                token.remaining = 0
+            logger.error("❌ Search failed: %s", e)
+        except Exception as e:
+            logger.error("❌ Search failed: %s", e)
+        
+        # Partial pages are still returned when the quota or a call runs out mid-way
+        del result.tweets[total:]
+        logger.info("✅ Found %d tweets", len(result.tweets))
+        return result
+
     def post_tweet(self, text: str, reply_to_tweet_id: str = None):
         """POSTING THAT WORKS - Using v2 API (YOUR WORKING CODE)"""
         try:
-            print(f"🐦 Posting: {text[:50]}...")
+            logger.info("🐦 Posting: %s...", text[:50])
             
             if reply_to_tweet_id:
                 # Post as reply using v2 API
@@ -115,61 +485,130 @@ class TwitterClient:
                     text=text,
                     in_reply_to_tweet_id=reply_to_tweet_id
                 )
-                print(f"✅ Reply posted to {reply_to_tweet_id}")
+                logger.info("✅ Reply posted to %s", reply_to_tweet_id)
             else:
                 # Post as new tweet
                 response = self.client_v2.create_tweet(text=text)
-                print(f"✅ Tweet posted")
+                logger.info("✅ Tweet posted")
             
-            print(f"📝 Tweet ID: {response.data['id']}")
+            logger.info("📝 Tweet ID: %s", response.data['id'])
             return {'success': True, 'tweet_id': response.data['id']}
             
         except Exception as e:
-            print(f"❌ Post failed: {e}")
+            logger.error("❌ Post failed: %s", e)
+            return {'success': False, 'error': str(e)}
+
+    def _make_async_client(self):
+        """AsyncClient with the same creds, for batched writes (needs tweepy[async])"""
+        from tweepy.asynchronous import AsyncClient
+        return AsyncClient(**asdict(self.creds), wait_on_rate_limit=False)
+
+    async def _run_batch(self, calls, concurrency: int):
+        """Run call(client) coroutines over one shared aiohttp session, at most `concurrency` in flight"""
+        import aiohttp
+        
+        client = self._make_async_client()
+        client.session = aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit_per_host=concurrency))
+        sem = asyncio.Semaphore(concurrency)
+        
+        async def bounded(call):
+            async with sem:
+                return await call(client)
+        
+        try:
+            return await asyncio.gather(*(bounded(call) for call in calls))
+        finally:
+            await client.session.close()
+
+    async def _post_async(self, client, text: str, reply_to_tweet_id: str = None):
+        """Async twin of post_tweet - same result dict"""
+        try:
+            response = await client.create_tweet(text=text, in_reply_to_tweet_id=reply_to_tweet_id)
+            logger.info("✅ Tweet posted: %s", response.data['id'])
+            return {'success': True, 'tweet_id': response.data['id']}
+        except Exception as e:
+            logger.error("❌ Post failed: %s", e)
             return {'success': False, 'error': str(e)}
 
+    async def post_batch(self, items, concurrency: int = 8):
+        """Post (text, reply_to_tweet_id) pairs concurrently; results keep input order"""
+        logger.info("🐦 Posting batch of %d tweets", len(items))
+        return await self._run_batch(
+            [partial(self._post_async, text=text, reply_to_tweet_id=reply_id) for text, reply_id in items],
+            concurrency
+        )
+
+    async def _like_async(self, client, tweet_id: str):
+        """Async twin of like_tweet - reports the tweet id with the outcome"""
+        try:
+            await client.like(tweet_id, user_auth=True)
+            logger.info("✅ Liked: %s", tweet_id)
+            return {'tweet_id': tweet_id, 'success': True}
+        except Exception as e:
+            logger.error("❌ Like failed: %s", e)
+            return {'tweet_id': tweet_id, 'success': False, 'error': str(e)}
+
+    async def _retweet_async(self, client, tweet_id: str):
+        """Async twin of retweet_tweet - reports the tweet id with the outcome"""
+        try:
+            await client.retweet(tweet_id, user_auth=True)
+            logger.info("✅ Retweeted: %s", tweet_id)
+            return {'tweet_id': tweet_id, 'success': True}
+        except Exception as e:
+            logger.error("❌ Retweet failed: %s", e)
+            return {'tweet_id': tweet_id, 'success': False, 'error': str(e)}
+
+    async def like_tweets(self, tweet_ids, concurrency: int = 4):
+        """Like many tweets concurrently; per-tweet results keep input order"""
+        logger.info("❤️  Liking batch of %d tweets", len(tweet_ids))
+        return await self._run_batch(
+            [partial(self._like_async, tweet_id=tweet_id) for tweet_id in tweet_ids],
+            concurrency
+        )
+
+    async def retweet_tweets(self, tweet_ids, concurrency: int = 4):
+        """Retweet many tweets concurrently; per-tweet results keep input order"""
+        logger.info("🔄 Retweeting batch of %d tweets", len(tweet_ids))
+        return await self._run_batch(
+            [partial(self._retweet_async, tweet_id=tweet_id) for tweet_id in tweet_ids],
+            concurrency
+        )
+
     def retweet_tweet(self, tweet_id: str):
         """Retweet using v2 API"""
         try:
-            user = self.client_v2.get_me()
-            user_id = user.data.id
-            
-            print(f"🔄 Retweeting: {tweet_id}")
-            response = self.client_v2.retweet(user_id, tweet_id)
-            print(f"✅ Retweeted: {tweet_id}")
+            logger.info("🔄 Retweeting: %s", tweet_id)
+            response = self.client_v2.retweet(tweet_id)
+            logger.info("✅ Retweeted: %s", tweet_id)
             return True
             
         except Exception as e:
-            print(f"❌ Retweet failed: {e}")
+            logger.error("❌ Retweet failed: %s", e)
             return False
 
     def like_tweet(self, tweet_id: str):
         """Like using v2 API"""
         try:
-            user = self.client_v2.get_me()
-            user_id = user.data.id
-            
-            print(f"❤️  Liking: {tweet_id}")
-            response = self.client_v2.like(user_id, tweet_id)
-            print(f"✅ Liked: {tweet_id}")
+            logger.info("❤️  Liking: %s", tweet_id)
+            response = self.client_v2.like(tweet_id)
+            logger.info("✅ Liked: %s", tweet_id)
             return True
             
         except Exception as e:
-            print(f"❌ Like failed: {e}")
+            logger.error("❌ Like failed: %s", e)
             return False
 
     def is_operational(self):
         return self.client_v2 is not None
 
     def get_usage_stats(self):
-        now = datetime.now()
-        time_since_reset = (now - self.last_reset_time).total_seconds()
-        reset_in = max(0, 900 - time_since_reset)
+        now = time.monotonic()
+        reset_in = max(0, min((token.reset_at for token in self.token_pool), default=now) - now)
         
         return {
             "searches_remaining": self.rate_limit_remaining,
             "searches_used": self.total_searches_used,
-            "searches_limit": 60,
+            "searches_limit": self.rate_limit_limit,
             "reset_in_minutes": int(reset_in / 60),
             "posting_limit": "100 posts/24hr"
         }
\ No newline at end of file
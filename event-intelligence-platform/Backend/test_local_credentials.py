@@ -1,32 +1,32 @@
 import tweepy
-import os
+from dataclasses import asdict
 from dotenv import load_dotenv
+from services.twitter_client import TwitterCreds, ConfigError
 
-load_dotenv()
+def main():
+    print("🔐 Testing LOCAL Credentials...")
 
-print("🔐 Testing LOCAL Credentials...")
+    # Same env creds the app's TwitterClient uses
+    try:
+        creds = TwitterCreds.from_env()
+    except ConfigError as e:
+        print(f"❌ LOCAL ERROR: {e}")
+        return
 
-# Use the SAME code that works in Colab
-API_KEY = os.getenv('TWITTER_API_KEY')
-API_SECRET = os.getenv('TWITTER_API_SECRET') 
-ACCESS_TOKEN = os.getenv('TWITTER_ACCESS_TOKEN')
-ACCESS_SECRET = os.getenv('TWITTER_ACCESS_TOKEN_SECRET')
+    print(f"API Key: {creds.consumer_key}")
+    print(f"Access Token: {creds.access_token}")
 
-print(f"API Key: {API_KEY}")
-print(f"Access Token: {ACCESS_TOKEN}")
+    try:
+        client = tweepy.Client(**asdict(creds))
 
-try:
-    client = tweepy.Client(
-        consumer_key=API_KEY,
-        consumer_secret=API_SECRET,
-        access_token=ACCESS_TOKEN,
-        access_token_secret=ACCESS_SECRET
-    )
-    
-    # Test posting
-    response = client.create_tweet(text="🧪 Test from LOCAL environment")
-    print("✅ LOCAL POSTING WORKS!")
-    print("Tweet ID:", response.data['id'])
-    
-except Exception as e:
-    print(f"❌ LOCAL ERROR: {e}")
\ No newline at end of file
+        # Test posting
+        response = client.create_tweet(text="🧪 Test from LOCAL environment")
+        print("✅ LOCAL POSTING WORKS!")
+        print("Tweet ID:", response.data['id'])
+
+    except Exception as e:
+        print(f"❌ LOCAL ERROR: {e}")
+
+if __name__ == "__main__":
+    load_dotenv()
+    main()